@@ -1,6 +1,8 @@
 import os
 import re
+import glob
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal, InvalidOperation
 from typing import Dict, Tuple
 
@@ -22,8 +24,18 @@ DATA_DIR = os.path.join(BASE_DIR, "data")
 
 CUSTOMERS_CSV = os.path.join(DATA_DIR, "customers_raw.csv")
 PRODUCTS_CSV = os.path.join(DATA_DIR, "products_raw.csv")
+# Can also be a directory or a glob of shards, e.g. os.path.join(DATA_DIR, "sales", "*.csv.gz")
 SALES_CSV = os.path.join(DATA_DIR, "sales_raw.csv")
 
+# Parallel readers used when an input is split into several shard files
+EXTRACT_WORKERS = min(4, os.cpu_count() or 1)
+
+# Compressed suffixes accepted for CSV inputs (decompression is done by pandas)
+COMPRESSED_SUFFIXES = (".gz", ".zst", ".bz2", ".xz", ".zip")
+
+# Uncompressed files at least this big are memory-mapped while parsing
+MMAP_MIN_BYTES = 64 * 1024 * 1024
+
 REPORT_FILE = "data_quality_report.txt"
 LOG_FILE = "etl_pipeline.log"
 
@@ -154,18 +166,126 @@ def write_report(report: dict, path: str = REPORT_FILE):
 # EXTRACT
 # =========================
 
+def natural_sort_key(path: str) -> list:
+    """
+    Sort key that orders numbered shards numerically:
+      part-2.csv -> part-10.csv (instead of part-10.csv -> part-2.csv)
+    """
+    return [int(chunk) if chunk.isdigit() else chunk.lower()
+            for chunk in re.split(r"(\d+)", path)]
+
+
+def csv_stem(path: str) -> str:
+    """
+    Returns the path without its compression suffix, lower-cased:
+      data/Part-1.CSV.GZ -> data/part-1.csv
+    Used to spot the same shard stored both plain and compressed.
+    """
+    lower = path.lower()
+    for ext in COMPRESSED_SUFFIXES:
+        if lower.endswith(ext):
+            return lower[:-len(ext)]
+    return lower
+
+
+def resolve_input_files(path: str) -> list:
+    """
+    Expands an input location into a list of files in natural file-name order.
+    Accepts:
+      - a single file (plain or compressed, e.g. sales_raw.csv.gz)
+      - a directory of shards (every *.csv / *.csv.<gz|zst|bz2|xz|zip> inside, any casing)
+      - a glob pattern (e.g. data/sales/part-*.csv.zst)
+    Zero-byte shards are skipped (they hold no rows). If a shard exists both plain
+    and compressed (part-1.csv + part-1.csv.gz), only the plain copy is kept.
+    Returns an empty list if nothing matches; raises EmptyDataError if every match is empty.
+    """
+    if os.path.isfile(path):
+        return [path]
+
+    if os.path.isdir(path):
+        csv_suffixes = (".csv",) + tuple(f".csv{ext}" for ext in COMPRESSED_SUFFIXES)
+        files = []
+        for name in os.listdir(path):
+            full = os.path.join(path, name)
+            if not os.path.isfile(full):
+                continue
+            if name.lower().endswith(csv_suffixes):
+                files.append(full)
+            else:
+                logging.warning(f"Skipping non-CSV file in {path}: {name}")
+    else:
+        files = [f for f in glob.glob(path) if os.path.isfile(f)]
+
+    if not files:
+        return []
+
+    non_empty = [f for f in files if os.path.getsize(f) > 0]
+    if not non_empty:
+        raise pd.errors.EmptyDataError(
+            f"All {len(files)} file(s) matched by {path} are empty"
+        )
+    if len(non_empty) < len(files):
+        logging.warning(f"Skipping {len(files) - len(non_empty)} empty shard(s) in {path}")
+
+    # Plain files sort before their compressed twins, so the plain copy is the one kept
+    by_stem = {}
+    for f in sorted(non_empty, key=lambda f: (csv_stem(f), f.lower() != csv_stem(f))):
+        stem = csv_stem(f)
+        if stem in by_stem:
+            logging.warning(f"Skipping {f}: same shard as {by_stem[stem]}")
+            continue
+        by_stem[stem] = f
+
+    return sorted(by_stem.values(), key=natural_sort_key)
+
+
+def read_csv_file(path: str) -> pd.DataFrame:
+    """
+    Reads one CSV file.
+    Compressed files are decompressed on the fly while parsing (no temp copy on disk).
+    Large uncompressed files are memory-mapped instead of being copied through Python buffers.
+    """
+    # pandas infers the compression from the suffix; this branch only avoids memory_map
+    if path.lower().endswith(COMPRESSED_SUFFIXES):
+        return pd.read_csv(path)
+
+    use_mmap = os.path.getsize(path) >= MMAP_MIN_BYTES
+    return pd.read_csv(path, memory_map=use_mmap)
+
+
 def extract_csv(path: str) -> pd.DataFrame:
     """
-    Reads a CSV file and returns a pandas DataFrame.
-    Fails fast if the file is missing.
+    Reads a CSV input and returns a pandas DataFrame.
+    The input can be a single (optionally compressed) file, a directory or a glob of shards.
+    Shards are read in parallel and concatenated in natural file-name order
+    (part-2 before part-10). Every shard must have the same header as the first one.
+    Fails fast if nothing is found or a shard's columns don't match.
     """
-    if not os.path.exists(path):
+    files = resolve_input_files(path)
+    if not files:
         raise FileNotFoundError(
             f"File not found: {path}. "
-            f"Make sure it is in the same folder as etl_pipeline.py"
+            f"Make sure it is in the data folder (or that the directory/glob matches CSV files)"
         )
 
-    df = pd.read_csv(path)
+    if len(files) == 1:
+        return read_csv_file(files[0])
+
+    logging.info(f"Reading {len(files)} shards from {path}...")
+    with ThreadPoolExecutor(max_workers=EXTRACT_WORKERS) as pool:
+        frames = list(pool.map(read_csv_file, files))
+
+    # A shard with a different (or missing) header would otherwise be
+    # concatenated as NaN columns and later dropped as "duplicates"
+    expected = list(frames[0].columns)
+    for file, frame in zip(files[1:], frames[1:]):
+        if list(frame.columns) != expected:
+            raise ValueError(
+                f"Column mismatch in shard {file}: "
+                f"expected {expected}, found {list(frame.columns)}"
+            )
+
+    df = pd.concat(frames, ignore_index=True)
     return df
 
 